@@ -0,0 +1,45 @@
+"""Add keyset pagination indexes
+
+Revision ID: f1afcf5015fa
+Revises: 65b3fb366780
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1afcf5015fa"
+down_revision: Union[str, None] = "65b3fb366780"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = "products", "categories", "brands", "tags"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_live_created_at_guid",
+                table,
+                ["created_at", "guid"],
+                schema="products",
+                postgresql_where=sa.text("removed_at IS NULL"),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                f"ix_{table}_live_created_at_guid",
+                table_name=table,
+                schema="products",
+                postgresql_concurrently=True,
+            )
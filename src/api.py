@@ -1,9 +1,12 @@
 import taskiq_fastapi
+from fastapi import Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from src.common.config import Config
 from src.common.cors import parse_origins
 from src.common.fastapi_utils import DependencyInjector, RouterBuilder
+from src.common.pagination import InvalidPagination
 from src.common.s3 import ObjectStorageGateway, get_local_s3_gateway
 from src.common.tasks import broker
 from src.products.api import router as products_router
@@ -35,6 +38,13 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(InvalidPagination)
+async def invalid_pagination_handler(request: Request, error: InvalidPagination):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(error)}
+    )
+
+
 @app.on_event("startup")
 async def app_startup():
     if not broker.is_worker_process:
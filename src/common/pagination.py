@@ -0,0 +1,87 @@
+import base64
+import binascii
+import datetime
+import json
+import typing
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import DateTime, Select, literal, tuple_
+from sqlalchemy.dialects import postgresql
+
+
+class InvalidPagination(ValueError):
+    pass
+
+
+class InvalidCursor(InvalidPagination):
+    pass
+
+
+@dataclass(frozen=True, init=True)
+class Cursor:
+    created_at: datetime.datetime
+    guid: uuid.UUID
+
+
+def encode_cursor(created_at: datetime.datetime, guid: uuid.UUID) -> str:
+    payload = json.dumps([created_at.isoformat(), str(guid)]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        created_at, guid = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        position = Cursor(
+            created_at=datetime.datetime.fromisoformat(created_at),
+            guid=uuid.UUID(guid),
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise InvalidCursor("Invalid cursor") from error
+    # created_at columns are naive, an offset would only fail in the driver
+    if position.created_at.tzinfo is not None:
+        raise InvalidCursor("Invalid cursor")
+    return position
+
+
+def validate_page_request(
+    page_number: int, page_size: int, cursor: typing.Optional[str]
+) -> None:
+    if page_size < 1:
+        raise InvalidPagination("page_size must be at least 1")
+    if page_number < 0:
+        raise InvalidPagination("page_number cannot be negative")
+    if cursor is not None and page_number != 0:
+        raise InvalidPagination("Use either page_number or cursor, not both")
+
+
+def paginate(
+    stmt: Select,
+    entity: typing.Any,
+    page_number: int,
+    page_size: int,
+    cursor: typing.Optional[str] = None,
+) -> Select:
+    validate_page_request(page_number, page_size, cursor)
+    # One extra row tells whether there is a next page without another query
+    stmt = stmt.order_by(entity.created_at, entity.guid).limit(page_size + 1)
+    if cursor is None:
+        return stmt.offset(page_number * page_size)
+    position = decode_cursor(cursor)
+    return stmt.where(
+        tuple_(entity.created_at, entity.guid)
+        > tuple_(
+            literal(position.created_at, DateTime),
+            literal(position.guid, postgresql.UUID(as_uuid=True)),
+        )
+    )
+
+
+def next_page_cursor(
+    rows: typing.Sequence[typing.Any], page_size: int
+) -> typing.Optional[str]:
+    if len(rows) <= page_size:
+        return None
+    last_row = rows[page_size - 1]
+    return encode_cursor(last_row.created_at, last_row.guid)
@@ -1,3 +1,4 @@
+import typing
 import uuid
 
 from fastapi import APIRouter, Depends, Response, UploadFile, status
@@ -19,9 +20,12 @@ router = APIRouter(tags=["product management"])
     name="Get product list",
 )
 async def get_products(
-    page_number: int = 0, page_size: int = 10, service: ProductService = Depends()
+    page_number: int = 0,
+    page_size: int = 10,
+    cursor: typing.Optional[str] = None,
+    service: ProductService = Depends(),
 ):
-    return await service.get_product_list(page_number, page_size)
+    return await service.get_product_list(page_number, page_size, cursor)
 
 
 @router.get(
@@ -87,9 +91,12 @@ async def delete_product(guid: uuid.UUID, service: ProductService = Depends()):
     name="List all categories",
 )
 async def get_categories(
-    page_number: int = 0, page_size: int = 10, service: ProductService = Depends()
+    page_number: int = 0,
+    page_size: int = 10,
+    cursor: typing.Optional[str] = None,
+    service: ProductService = Depends(),
 ):
-    return await service.get_category_list(page_number, page_size)
+    return await service.get_category_list(page_number, page_size, cursor)
 
 
 @router.post(
@@ -148,9 +155,12 @@ async def delete_category(guid: uuid.UUID, service: ProductService = Depends()):
     name="List all brands",
 )
 async def get_brands(
-    page_number: int = 0, page_size: int = 10, service: ProductService = Depends()
+    page_number: int = 0,
+    page_size: int = 10,
+    cursor: typing.Optional[str] = None,
+    service: ProductService = Depends(),
 ):
-    return await service.get_brands_list(page_number, page_size)
+    return await service.get_brands_list(page_number, page_size, cursor)
 
 
 @router.post(
@@ -207,9 +217,12 @@ async def delete_brand(guid: uuid.UUID, service: ProductService = Depends()):
     name="List all tags",
 )
 async def get_tags(
-    page_number: int = 0, page_size: int = 10, service: ProductService = Depends()
+    page_number: int = 0,
+    page_size: int = 10,
+    cursor: typing.Optional[str] = None,
+    service: ProductService = Depends(),
 ):
-    return await service.get_tags_list(page_number, page_size)
+    return await service.get_tags_list(page_number, page_size, cursor)
 
 
 @router.post(
@@ -66,6 +66,19 @@ class BrandItem(BaseModel):
     model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
+class Page(BaseModel):
+    # page_number and pages_count are null when paging with a cursor
+    page_number: typing.Optional[int] = Field(examples=[1])
+    pages_count: typing.Optional[int] = Field(examples=[10])
+    page_size: int = Field(examples=[5])
+    next_cursor: typing.Optional[str] = Field(
+        examples=[
+            "WyIyMDI0LTA1LTAzVDAwOjM0OjA2IiwgIjFiOWQ2YmNkLWJiZmQtNGIyZC05YjVk"
+            "LWFiOGRmYmJkNGJlZCJd"
+        ]
+    )
+
+
 class ProductDetail(BaseModel):
     guid: uuid.UUID = Field(examples=[uuid.uuid4()])
     sku: str = Field(examples=["2,51,594"])
@@ -110,10 +123,7 @@ class ProductListItem(BaseModel):
     model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
-class ProductList(BaseModel):
-    page_number: int = Field(examples=[1])
-    pages_count: int = Field(examples=[10])
-    page_size: int = Field(examples=[5])
+class ProductList(Page):
     items: typing.List[ProductListItem]
 
     model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -132,10 +142,7 @@ class NewTag(BaseModel):
     )
 
 
-class TagsList(BaseModel):
-    page_number: int = Field(examples=[1])
-    pages_count: int = Field(examples=[10])
-    page_size: int = Field(examples=[5])
+class TagsList(Page):
     items: typing.List[TagItem]
 
 
@@ -144,10 +151,7 @@ class CategoryWrite(BaseModel):
     name_pl: str = Field(min_length=3, max_length=64, examples=["Warzywa"])
 
 
-class CategoryList(BaseModel):
-    page_number: int = Field(examples=[1])
-    pages_count: int = Field(examples=[10])
-    page_size: int = Field(examples=[5])
+class CategoryList(Page):
     items: typing.List[CategoryItem]
 
 
@@ -160,10 +164,7 @@ class BrandWrite(BaseModel):
     )
 
 
-class BrandList(BaseModel):
-    page_number: int = Field(examples=[1])
-    pages_count: int = Field(examples=[10])
-    page_size: int = Field(examples=[5])
+class BrandList(Page):
     items: typing.List[BrandItem]
 
 
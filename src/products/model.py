@@ -3,8 +3,8 @@ import typing
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import (Column, DateTime, ForeignKey, Integer, String, Table,
-                        Text, UniqueConstraint)
+from sqlalchemy import (Column, DateTime, ForeignKey, Index, Integer, String,
+                        Table, Text, UniqueConstraint, text)
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,7 +26,15 @@ class Brand(Entity):
     UniqueConstraint(name, removed_at, name="unique_brand_name")
 
     __tablename__ = "brands"
-    __table_args__ = {"schema": SCHEMA}
+    __table_args__ = (
+        Index(
+            "ix_brands_live_created_at_guid",
+            "created_at",
+            "guid",
+            postgresql_where=text("removed_at IS NULL"),
+        ),
+        {"schema": SCHEMA},
+    )
 
     def __init__(
         self, name: str, logo_url: typing.Optional[str], created_at: datetime.datetime
@@ -52,7 +60,15 @@ class Category(Entity):
     UniqueConstraint(name_pl, removed_at, name="unique_category_name_pl")
 
     __tablename__ = "categories"
-    __table_args__ = {"schema": SCHEMA}
+    __table_args__ = (
+        Index(
+            "ix_categories_live_created_at_guid",
+            "created_at",
+            "guid",
+            postgresql_where=text("removed_at IS NULL"),
+        ),
+        {"schema": SCHEMA},
+    )
 
     def __init__(self, name_en: str, name_pl, created_at: datetime.datetime):
         self.guid: uuid.UUID = uuid.uuid4()
@@ -75,7 +91,15 @@ class Tag(Entity):
     UniqueConstraint(en, removed_at, name="unique_tag_en")
 
     __tablename__ = "tags"
-    __table_args__ = {"schema": SCHEMA}
+    __table_args__ = (
+        Index(
+            "ix_tags_live_created_at_guid",
+            "created_at",
+            "guid",
+            postgresql_where=text("removed_at IS NULL"),
+        ),
+        {"schema": SCHEMA},
+    )
 
     def __init__(self, en: str, pl: str, created_at: datetime.datetime):
         self.guid: uuid.UUID = uuid.uuid4()
@@ -132,7 +156,15 @@ class Product(Entity):
     UniqueConstraint(name_pl, removed_at, name="unique_product_name_pl")
 
     __tablename__ = "products"
-    __table_args__ = {"schema": SCHEMA}
+    __table_args__ = (
+        Index(
+            "ix_products_live_created_at_guid",
+            "created_at",
+            "guid",
+            postgresql_where=text("removed_at IS NULL"),
+        ),
+        {"schema": SCHEMA},
+    )
 
     def __init__(
         self,
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import joinedload
 
 from src.common.config import Config
+from src.common.pagination import next_page_cursor, paginate
 from src.common.s3 import ObjectStorageGateway, UploadResult
 from src.common.sql import get_db
 from src.common.time import LocalTimeProvider, TimeProvider
@@ -55,6 +56,14 @@ class TagWriteResult:
     info: typing.Optional[str] = None
 
 
+@dataclass(init=True, frozen=True)
+class _Page:
+    rows: typing.Sequence[typing.Any]
+    next_cursor: typing.Optional[str] = None
+    page_number: typing.Optional[int] = None
+    pages_count: typing.Optional[int] = None
+
+
 class ProductService:
     def __init__(
         self,
@@ -184,31 +193,16 @@ class ProductService:
             success=True, product=ProductDetail.model_validate(product)
         )
 
-    async def get_product_list(self, page_number: int, page_size: int) -> ProductList:
-        products_stmt = (
-            select(Product)
-            .where(Product.removed_at.is_(None))
-            .limit(page_size)
-            .offset(page_number * page_size)
-        )
-
-        count_stmt = select(func.count()).select_from(
-            select(Product).where(Product.removed_at.is_(None)).subquery()
-        )
-        async with self._session_factory() as session:
-            products_result = await session.execute(products_stmt)
-
-            count_result = await session.execute(count_stmt)
-
-        products = products_result.unique().scalars().all()
-        all_products_count = count_result.scalar_one()
-        pages_count = math.ceil(all_products_count / page_size)
-
+    async def get_product_list(
+        self, page_number: int, page_size: int, cursor: typing.Optional[str] = None
+    ) -> ProductList:
+        page = await self._get_page(Product, page_number, page_size, cursor)
         return ProductList(
-            page_number=page_number,
-            pages_count=pages_count,
+            page_number=page.page_number,
+            pages_count=page.pages_count,
             page_size=page_size,
-            items=[ProductListItem.model_validate(product) for product in products],
+            next_cursor=page.next_cursor,
+            items=[ProductListItem.model_validate(row) for row in page.rows],
         )
 
     async def get_product_details(
@@ -299,30 +293,16 @@ class ProductService:
             success=True, category=CategoryItem.model_validate(category)
         )
 
-    async def get_category_list(self, page_number: int, page_size: int) -> CategoryList:
-        categories_stmt = (
-            select(Category)
-            .where(Category.removed_at.is_(None))
-            .limit(page_size)
-            .offset(page_number * page_size)
-        )
-
-        count_stmt = select(func.count()).select_from(
-            select(Category).where(Category.removed_at.is_(None)).subquery()
-        )
-
-        async with self._session_factory() as session:
-            categories_result = await session.execute(categories_stmt)
-            count_result = await session.execute(count_stmt)
-
-        categories = categories_result.unique().scalars().all()
-        all_categories_count = count_result.unique().scalar_one()
-        pages_count = math.ceil(all_categories_count / page_size)
+    async def get_category_list(
+        self, page_number: int, page_size: int, cursor: typing.Optional[str] = None
+    ) -> CategoryList:
+        page = await self._get_page(Category, page_number, page_size, cursor)
         return CategoryList(
-            page_number=page_number,
+            page_number=page.page_number,
+            pages_count=page.pages_count,
             page_size=page_size,
-            pages_count=pages_count,
-            items=[CategoryItem.model_validate(category) for category in categories],
+            next_cursor=page.next_cursor,
+            items=[CategoryItem.model_validate(row) for row in page.rows],
         )
 
     async def remove_category(self, guid: uuid.UUID) -> Result:
@@ -355,28 +335,16 @@ class ProductService:
             await session.commit()
         return Result(success=True)
 
-    async def get_brands_list(self, page_number: int, page_size: int) -> BrandList:
-        brands_stmt = (
-            select(Brand)
-            .where(Brand.removed_at.is_(None))
-            .limit(page_size)
-            .offset(page_size * page_number)
-        )
-        count_stmt = select(func.count()).select_from(
-            select(Brand).where(Brand.removed_at.is_(None)).subquery()
-        )
-        async with self._session_factory() as session:
-            brands_result = await session.execute(brands_stmt)
-            count_result = await session.execute(count_stmt)
-
-        brands = brands_result.unique().scalars().all()
-        all_brands_count = count_result.unique().scalar_one()
-        pages_count = math.ceil(all_brands_count / page_size)
+    async def get_brands_list(
+        self, page_number: int, page_size: int, cursor: typing.Optional[str] = None
+    ) -> BrandList:
+        page = await self._get_page(Brand, page_number, page_size, cursor)
         return BrandList(
-            page_number=page_number,
+            page_number=page.page_number,
+            pages_count=page.pages_count,
             page_size=page_size,
-            pages_count=pages_count,
-            items=[BrandItem.model_validate(brand) for brand in brands],
+            next_cursor=page.next_cursor,
+            items=[BrandItem.model_validate(row) for row in page.rows],
         )
 
     async def add_brand(self, dto: BrandWrite) -> BrandWriteResult:
@@ -446,28 +414,16 @@ class ProductService:
             await session.commit()
         return TagWriteResult(success=True, tag=TagItem.model_validate(tag))
 
-    async def get_tags_list(self, page_number: int, page_size: int) -> TagsList:
-        tags_stmt = (
-            select(Tag)
-            .where(Tag.removed_at.is_(None))
-            .limit(page_size)
-            .offset(page_size * page_number)
-        )
-        count_stmt = select(func.count()).select_from(
-            select(Tag).where(Tag.removed_at.is_(None)).subquery()
-        )
-        async with self._session_factory() as session:
-            tags_result = await session.execute(tags_stmt)
-            count_result = await session.execute(count_stmt)
-
-        tags = tags_result.unique().scalars().all()
-        all_tags_count = count_result.unique().scalar_one()
-        pages_count = math.ceil(all_tags_count / page_size)
+    async def get_tags_list(
+        self, page_number: int, page_size: int, cursor: typing.Optional[str] = None
+    ) -> TagsList:
+        page = await self._get_page(Tag, page_number, page_size, cursor)
         return TagsList(
-            page_number=page_number,
+            page_number=page.page_number,
+            pages_count=page.pages_count,
             page_size=page_size,
-            pages_count=pages_count,
-            items=[TagItem.model_validate(tag) for tag in tags],
+            next_cursor=page.next_cursor,
+            items=[TagItem.model_validate(row) for row in page.rows],
         )
 
     async def remove_tag(self, guid: uuid.UUID) -> Result:
@@ -510,6 +466,40 @@ class ProductService:
         file_key = f"{str(uuid.uuid4())}.{file_extension}"
         return self._s3_gateway.upload_file("brand-logos", file_key, file)
 
+    async def _get_page(
+        self,
+        entity: typing.Any,
+        page_number: int,
+        page_size: int,
+        cursor: typing.Optional[str],
+    ) -> _Page:
+        page_stmt = paginate(
+            select(entity).where(entity.removed_at.is_(None)),
+            entity,
+            page_number,
+            page_size,
+            cursor,
+        )
+        async with self._session_factory() as session:
+            page_result = await session.execute(page_stmt)
+            rows = page_result.scalars().all()
+            # Page numbers and totals mean nothing for a cursor, skip the count
+            if cursor is not None:
+                return _Page(
+                    rows=rows[:page_size], next_cursor=next_page_cursor(rows, page_size)
+                )
+            count_stmt = select(func.count()).select_from(
+                select(entity).where(entity.removed_at.is_(None)).subquery()
+            )
+            count_result = await session.execute(count_stmt)
+        all_rows_count = count_result.scalar_one()
+        return _Page(
+            rows=rows[:page_size],
+            next_cursor=next_page_cursor(rows, page_size),
+            page_number=page_number,
+            pages_count=math.ceil(all_rows_count / page_size),
+        )
+
     async def _post_product_update_to_store_inbox(
         self, product: Product, session: AsyncSession
     ) -> uuid.UUID:
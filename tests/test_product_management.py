@@ -3,11 +3,12 @@ import uuid
 from decimal import Decimal
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncConnection, async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 import alembic.config
 from alembic import command
 from src.common.config import Config
+from src.common.pagination import InvalidCursor, InvalidPagination
 from src.common.s3 import get_local_s3_gateway
 from src.common.sql import (connection_string_from_config,
                             create_database_engine, dispose_engine,
@@ -18,15 +19,11 @@ from src.products.service import ProductService
 from src.store.service import StoreService
 
 
-def migrate(connection: AsyncConnection, alembic_config: alembic.config.Config) -> None:
-    alembic_config.attributes["connection"] = connection
+def migrate(alembic_config: alembic.config.Config) -> None:
     command.upgrade(alembic_config, "head")
 
 
-def downgrade(
-    connection: AsyncConnection, alembic_config: alembic.config.Config
-) -> None:
-    alembic_config.attributes["connection"] = connection
+def downgrade(alembic_config: alembic.config.Config) -> None:
     command.downgrade(alembic_config, "base")
 
 
@@ -36,16 +33,16 @@ async def database() -> typing.AsyncGenerator[async_sessionmaker, None]:
     dns = connection_string_from_config(config_)
     engine = create_database_engine(dns)
 
+    # alembic/env.py migrates on its own connection; holding a transaction
+    # open here would block CREATE INDEX CONCURRENTLY forever
     alembic_config = alembic.config.Config()
     alembic_config.set_main_option("script_location", "alembic")
-    async with engine.begin() as connection:
-        migrate(connection, alembic_config)
+    migrate(alembic_config)
 
     session_factory = get_session_factory(engine)
     yield session_factory
 
-    async with engine.begin() as connection:
-        downgrade(connection, alembic_config)
+    downgrade(alembic_config)
 
     await dispose_engine(engine)
 
@@ -64,6 +61,16 @@ def tag_green() -> NewTag:
     return NewTag(en="Green", pl="Zielone")
 
 
+def tags_colors() -> typing.List[NewTag]:
+    return [
+        NewTag(en="Green", pl="Zielone"),
+        NewTag(en="Red", pl="Czerwone"),
+        NewTag(en="Yellow", pl="Żółte"),
+        NewTag(en="Orange", pl="Pomarańczowe"),
+        NewTag(en="Purple", pl="Fioletowe"),
+    ]
+
+
 def category_vegetables() -> CategoryWrite:
     return CategoryWrite(name_en="Vegetables", name_pl="Warzywa")
 
@@ -310,3 +317,69 @@ async def test_product_deletes(service: ProductService):
     found_product = await service.get_product_details(product.product.guid)
     # THEN it can be found no more
     assert not found_product
+
+
+async def test_tags_cursor_walks_all_tags_once(service: ProductService):
+    # GIVEN several tags, one of them removed
+    added = [await service.add_tag(tag) for tag in tags_colors()]
+    assert all(result.tag for result in added)
+    removed_tag = added[2].tag
+    assert removed_tag
+    await service.remove_tag(removed_tag.guid)
+    # WHEN the tags are walked page by page with the cursor
+    seen = []
+    page = await service.get_tags_list(0, 2)
+    seen.extend(page.items)
+    while page.next_cursor:
+        page = await service.get_tags_list(0, 2, page.next_cursor)
+        assert page.page_number is None and page.pages_count is None
+        seen.extend(page.items)
+    # THEN every live tag is returned exactly once, in creation order
+    assert [tag.guid for tag in seen] == [
+        result.tag.guid
+        for result in added
+        if result.tag and result.tag.guid != removed_tag.guid
+    ]
+
+
+async def test_tags_order_is_stable_across_pages(service: ProductService):
+    # GIVEN several tags
+    for tag in tags_colors():
+        await service.add_tag(tag)
+    # WHEN the same pages are requested twice with page numbers
+    first_pass = [await service.get_tags_list(n, 2) for n in range(3)]
+    second_pass = [await service.get_tags_list(n, 2) for n in range(3)]
+    # THEN both passes return the same tags in the same order, without overlap
+    assert first_pass == second_pass
+    guids = [tag.guid for page in first_pass for tag in page.items]
+    assert len(guids) == len(set(guids)) == 5
+    assert first_pass[0].pages_count == 3
+    assert first_pass[2].next_cursor is None
+
+
+async def test_malformed_cursor_is_rejected(service: ProductService):
+    # GIVEN clean state
+    # WHEN a list is requested with a malformed cursor
+    # THEN the request is rejected
+    with pytest.raises(InvalidCursor):
+        await service.get_product_list(0, 10, "not-a-cursor")
+
+
+async def test_page_size_must_be_positive(service: ProductService):
+    # GIVEN clean state
+    # WHEN a list is requested with an empty page
+    # THEN the request is rejected
+    with pytest.raises(InvalidPagination):
+        await service.get_tags_list(0, 0)
+
+
+async def test_cursor_and_page_number_cannot_be_combined(service: ProductService):
+    # GIVEN a valid cursor
+    await service.add_tag(tag_green())
+    await service.add_tag(NewTag(en="Red", pl="Czerwone"))
+    page = await service.get_tags_list(0, 1)
+    assert page.next_cursor
+    # WHEN it is sent together with a page number
+    # THEN the request is rejected
+    with pytest.raises(InvalidPagination):
+        await service.get_tags_list(1, 1, page.next_cursor)